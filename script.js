@@ -7,6 +7,11 @@
     baseUrl: 'https://api.pluggy.ai'
   });
 
+  const AUTH_BODY = JSON.stringify({
+    clientId: pluggyConfig.clientId,
+    clientSecret: pluggyConfig.clientSecret
+  });
+
   const refs = {
     form: document.getElementById('connect-form'),
     name: document.getElementById('full-name'),
@@ -24,11 +29,16 @@
     logsVisible: false,
     logCount: 0,
     connectToken: null,
+    apiKey: null,
+    apiKeyExpiresAt: 0,
+    apiKeyMonotonicExpiresAt: 0,
     pluggyInstance: null,
     pluggyReadyPromise: null
   };
 
   const LOG_LIMIT = 80;
+  // Pluggy API keys expire after 2h; renew a bit earlier to stay safe.
+  const API_KEY_TTL_MS = 110 * 60 * 1000;
 
   function setStatus(label, state) {
     refs.statusChip.textContent = label;
@@ -108,7 +118,29 @@
     return uiState.pluggyReadyPromise;
   }
 
+  // Date.now() keeps counting while the machine sleeps; performance.now()
+  // guards against the wall clock being set backwards. Trust the key only
+  // while both clocks agree it is still valid.
+  function hasCachedApiKey() {
+    return (
+      Boolean(uiState.apiKey) &&
+      Date.now() < uiState.apiKeyExpiresAt &&
+      performance.now() < uiState.apiKeyMonotonicExpiresAt
+    );
+  }
+
+  function clearCachedApiKey() {
+    uiState.apiKey = null;
+    uiState.apiKeyExpiresAt = 0;
+    uiState.apiKeyMonotonicExpiresAt = 0;
+  }
+
   async function authenticatePluggy() {
+    if (hasCachedApiKey()) {
+      pushLog('Reutilizando API key em cache.');
+      return uiState.apiKey;
+    }
+
     pushLog('Autenticando com Pluggy...');
     const response = await fetch(`${pluggyConfig.baseUrl}/auth`, {
       method: 'POST',
@@ -116,10 +148,7 @@
         Accept: 'application/json',
         'Content-Type': 'application/json'
       },
-      body: JSON.stringify({
-        clientId: pluggyConfig.clientId,
-        clientSecret: pluggyConfig.clientSecret
-      })
+      body: AUTH_BODY
     });
 
     if (!response.ok) {
@@ -130,6 +159,9 @@
     if (!data.apiKey) {
       throw new Error('API key não retornada pelo Pluggy.');
     }
+    uiState.apiKey = data.apiKey;
+    uiState.apiKeyExpiresAt = Date.now() + API_KEY_TTL_MS;
+    uiState.apiKeyMonotonicExpiresAt = performance.now() + API_KEY_TTL_MS;
     pushLog('API key recebida com sucesso.', 'success');
     return data.apiKey;
   }
@@ -150,7 +182,12 @@
 
     if (!response.ok) {
       const info = await response.text();
-      throw new Error(`Erro ao gerar token (${response.status}): ${info}`);
+      const error = new Error(`Erro ao gerar token (${response.status}): ${info}`);
+      error.authRejected = response.status === 401 || response.status === 403;
+      if (error.authRejected) {
+        clearCachedApiKey();
+      }
+      throw error;
     }
 
     const data = await response.json();
@@ -162,6 +199,21 @@
     return data.accessToken;
   }
 
+  async function obtainConnectToken(userId) {
+    const fromCache = hasCachedApiKey();
+    const apiKey = await authenticatePluggy();
+    try {
+      return await requestConnectToken(apiKey, userId);
+    } catch (error) {
+      if (!fromCache || !error.authRejected) {
+        throw error;
+      }
+      pushLog('API key em cache rejeitada. Autenticando novamente...');
+      const freshApiKey = await authenticatePluggy();
+      return requestConnectToken(freshApiKey, userId);
+    }
+  }
+
   function deriveUserId() {
     const email = refs.email.value.trim();
     if (email) {
@@ -259,8 +311,7 @@
 
     try {
       const userId = deriveUserId();
-      const apiKey = await authenticatePluggy();
-      const connectToken = await requestConnectToken(apiKey, userId);
+      const connectToken = await obtainConnectToken(userId);
       const metadata = {
         name: refs.name.value.trim() || undefined,
         email: refs.email.value.trim() || undefined